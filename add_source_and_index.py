@@ -1,26 +1,55 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(raw: bytes):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(data) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(data, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
+
 
 def main() -> None:
     base = Path(__file__).resolve().parent
     path = base / "tanjing.json"
 
-    data = json.loads(path.read_text(encoding="utf-8"))
+    # 字节直读：json/orjson 都能直接吃 bytes，省掉整文件的 UTF-8 解码
+    data = _loads(path.read_bytes())
 
-    if isinstance(data, list):
-        for idx, item in enumerate(data, start=1):
-            if isinstance(item, dict):
-                item["source"] = "liuzutanjing"
-                item["index"] = idx
-    else:
+    if not isinstance(data, list):
         raise TypeError("Expected top-level JSON array in tanjing.json")
 
-    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    changed = False
+    for idx, item in enumerate(data, start=1):
+        if not isinstance(item, dict):
+            continue
+        if item.get("source") != "liuzutanjing" or item.get("index") != idx:
+            item["source"] = "liuzutanjing"
+            item["index"] = idx
+            changed = True
+
+    # 已经全部标注过就不重写文件，重复运行保持幂等（mtime 也不会变）
+    if not changed:
+        return
+
+    # 先写临时文件再原子替换：中途崩溃也不会留下半截的 tanjing.json
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(_dumps(data))
+    os.replace(tmp, path)
 
 
 if __name__ == "__main__":
     main()
-
@@ -1,12 +1,24 @@
+import xml.etree.ElementTree as ET
+import zipfile
 from pathlib import Path
 
-from docx import Document
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+def iter_paragraph_texts(source: Path):
+    """直接解包 .docx 读取 word/document.xml，逐段落产出纯文本。
+
+    只做文字提取时无需经过 python-docx 的段落/样式对象模型，
+    拼接每个 w:p 下的 w:t 文本节点即可，速度更快、内存占用更低。
+    """
+    with zipfile.ZipFile(source) as z, z.open("word/document.xml") as f:
+        tree = ET.parse(f)
+    for p in tree.iter(f"{_W_NS}p"):
+        yield "".join(t.text or "" for t in p.iter(f"{_W_NS}t"))
 
 
 def docx_to_md(source: Path, target: Path) -> None:
-    doc = Document(str(source))
-    lines = [para.text for para in doc.paragraphs]
-    text = "\n".join(lines)
+    text = "\n".join(iter_paragraph_texts(source))
     target.write_text(text, encoding="utf-8")
 
 
@@ -15,4 +27,3 @@ if __name__ == "__main__":
     source = base / "系统提示词.docx"
     target = base / "系统提示词.md"
     docx_to_md(source, target)
-
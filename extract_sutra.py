@@ -1,8 +1,6 @@
-import docx
-import sys
+from docx_to_md import iter_paragraph_texts
 
-doc = docx.Document('六祖坛经.docx')
-lines = [p.text for p in doc.paragraphs if p.text.strip()]
+lines = [text for text in iter_paragraph_texts('六祖坛经.docx') if text.strip()]
 with open('sutra.txt', 'w', encoding='utf-8') as f:
     for line in lines:
         f.write(line + '\n')
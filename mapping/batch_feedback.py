@@ -54,6 +54,7 @@ from blind_draw_gui import (
     SYSTEM_PROMPT_PATH,
     TANJING_PATH,
     blind_draw_once,
+    build_draw_index,
     format_result,
     get_next_feedback_id,
     load_system_prompts,
@@ -170,9 +171,9 @@ def run_batch(
     base_url: str,
     main_model_key: str,
     tag_model_key: str,
-    valid_req_keys: list[str],
+    valid_req_keys: set[str],
     req_keys_text: str,
-    items: list,
+    draw_index: dict,
 ) -> tuple[int, int]:
     """处理场景列表：
     - 选标签：使用 tag_model_key（Qwen 专用）；
@@ -242,7 +243,7 @@ def run_batch(
         attempts = 0
         while written_this_scene < 20 and attempts < max_attempts:
             attempts += 1
-            drawn = blind_draw_once(items, req_key)
+            drawn = blind_draw_once(draw_index, req_key)
             if not drawn:
                 print(f"  无更多候选签文，结束该场景抽签", flush=True)
                 break
@@ -418,6 +419,7 @@ def main() -> int:
     scenes = load_system_prompts(SYSTEM_PROMPT_PATH)
     valid_req_keys, req_keys_text = build_req_keys_text(scenes)
     items = load_tanjing_items(TANJING_PATH)
+    draw_index = build_draw_index(items)
     ok_scenes, total_records = run_batch(
         args.scenarios,
         args.limit,
@@ -426,7 +428,7 @@ def main() -> int:
         tag_model_key,
         valid_req_keys,
         req_keys_text,
-        items,
+        draw_index,
     )
     print(f"\n完成: 成功处理 {ok_scenes} 个场景，共写入 {total_records} 条到 {FEEDBACK_LOG_PATH}", flush=True)
     return 0
@@ -22,10 +22,14 @@
 
 from __future__ import annotations
 
+import atexit
 import json
+import math
 import os
+import pickle
 import random
 import re
+from array import array
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
@@ -33,6 +37,11 @@ from typing import Any, Dict, List, Tuple
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+try:
+    import orjson
+except ImportError:  # orjson 仅作加速，缺失时退回标准库 json
+    orjson = None
+
 
 ROOT_DIR = Path(__file__).resolve().parent.parent
 TEXT_MATERIAL_PATH = ROOT_DIR / "text" / "textMaterial.json"
@@ -40,6 +49,18 @@ SYSTEM_PROMPT_PATH = ROOT_DIR / "系统提示词.md"
 # 新版反馈文件：包含 angle 字段与双重轮盘跑批结果，旧版 feedback_log.jsonl 保留作历史兼容
 FEEDBACK_LOG_PATH = ROOT_DIR / "mapping" / "feedback_log_v2.jsonl"
 
+# 《系统提示词.md》行级解析模式，模块加载时编译一次。
+# 三类行（大场景 / Option / 子场景）合并为一个带命名分组的交替式，
+# 每行只需进入正则引擎一次，由命中的分组决定分支：
+# - 大场景：1. 【樊笼】
+# - Option：Option_A（贪）：仰高不及，颓卧尘埃。
+# - 子场景：樊笼-形如槁木：
+_LINE_RE = re.compile(
+    r"^(?:\d+\.\s*【(?P<big>.+?)】"
+    r"|Option_(?P<opt_letter>[ABC])[（(].*?[）)][:：]\s*(?P<opt_phrase>.+)"
+    r"|(?P<sub>[^\s]+-[^：]+)：)"
+)
+
 
 def load_system_prompts(path: Path) -> Dict[str, Dict[str, Dict[str, str]]]:
     """
@@ -64,35 +85,35 @@ def load_system_prompts(path: Path) -> Dict[str, Dict[str, Dict[str, str]]]:
     if not path.is_file():
         raise FileNotFoundError(f"未找到系统提示词文件：{path}")
 
-    big_scene_pattern = re.compile(r"^\d+\.\s*【(.+?)】")
-    subscene_pattern = re.compile(r"^([^\s]+-[^：]+)：")
-    option_pattern = re.compile(r"^Option_([ABC])[（(].*?[）)][:：]\s*(.+)$")
-
     with path.open("r", encoding="utf-8") as f:
-        for raw_line in f:
-            line = raw_line.strip()
-            if not line:
-                continue
-
-            m_big = big_scene_pattern.match(line)
-            if m_big:
-                current_scene = m_big.group(1)
-                scenes.setdefault(current_scene, {})
-                current_subscene = None
+        # filter(None, ...) 在 C 迭代层剔掉空行，循环体不再做空判断
+        for line in filter(None, (raw_line.strip() for raw_line in f)):
+            # 快路径：先用 C 级字符串判断粗筛行首特征，
+            # 绝大多数正文行（三类行都不可能命中）直接跳过正则引擎
+            if not (
+                line[:1].isdigit()
+                or line.startswith("Option_")
+                or ("-" in line and "：" in line)
+            ):
                 continue
 
-            m_sub = subscene_pattern.match(line)
-            if m_sub and current_scene:
-                candidate = m_sub.group(1)
-                if candidate.startswith(current_scene + "-"):
-                    current_subscene = candidate
-                    scenes[current_scene].setdefault(current_subscene, {})
+            m = _LINE_RE.match(line)
+            if not m:
                 continue
 
-            m_opt = option_pattern.match(line)
-            if m_opt and current_scene and current_subscene:
-                letter = m_opt.group(1)
-                phrase = m_opt.group(2).strip()
+            if m.group("big"):
+                current_scene = m.group("big")
+                scenes.setdefault(current_scene, {})
+                current_subscene = None
+            elif m.group("sub"):
+                if current_scene:
+                    candidate = m.group("sub")
+                    if candidate.startswith(current_scene + "-"):
+                        current_subscene = candidate
+                        scenes[current_scene].setdefault(current_subscene, {})
+            elif current_scene and current_subscene:
+                letter = m.group("opt_letter")
+                phrase = m.group("opt_phrase").strip()
                 scenes[current_scene][current_subscene][letter] = phrase
 
     return scenes
@@ -102,8 +123,12 @@ def load_text_material_items(path: Path) -> List[Dict[str, Any]]:
     if not path.is_file():
         raise FileNotFoundError(f"未找到数据文件：{path}")
 
-    with path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
+    if orjson is not None:
+        # orjson 直接吃 bytes，省去整文件的 UTF-8 预解码
+        data = orjson.loads(path.read_bytes())
+    else:
+        with path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
 
     if not isinstance(data, list):
         raise ValueError("textMaterial.json 顶层结构应为列表。")
@@ -111,24 +136,187 @@ def load_text_material_items(path: Path) -> List[Dict[str, Any]]:
     return data
 
 
+# 兼容旧命名：数据文件早期叫 tanjing.json，跑批脚本仍按旧名导入
+TANJING_PATH = TEXT_MATERIAL_PATH
+load_tanjing_items = load_text_material_items
+
+
+def _load_cached(path: Path, parser):
+    """带磁盘缓存的加载：把解析结果 pickle 到旁路 .cache.pkl 文件。
+
+    缓存头为源文件的 (st_mtime_ns, st_size)；匹配时直接反序列化，跳过
+    正则解析 / JSON 解析；不匹配或缓存损坏时重新解析并覆盖缓存。
+    缓存读写失败只影响速度，不影响结果。
+    """
+    cache_path = path.with_suffix(path.suffix + ".cache.pkl")
+    try:
+        stat = path.stat()
+        header = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        return parser(path)
+    try:
+        with cache_path.open("rb") as f:
+            cached_header, parsed = pickle.load(f)
+        if cached_header == header:
+            return parsed
+    except Exception:
+        pass
+    parsed = parser(path)
+    try:
+        with cache_path.open("wb") as f:
+            pickle.dump((header, parsed), f, protocol=5)
+    except OSError:
+        pass
+    return parsed
+
+
+# 第 1 重轮盘：四个分数档位的预设权重
+TIER_BASE_WEIGHTS: Dict[str, float] = {
+    "SSR": 75.0,  # w >= 100
+    "SR": 15.0,   # 80 <= w < 100
+    "R": 8.0,     # 60 <= w < 80
+    "N": 2.0,     # 0 < w < 60
+}
+
+# req_key -> (候选签文列表, 有效权重列, 别名法 prob 表, 别名法 alias 表)
+# SoA 布局：签文引用与权重分列存放，权重列是紧凑的 array('d')，
+# 重筛/重建采样器时无需再回到逐条 dict 里取数
+DrawIndex = Dict[
+    str,
+    Tuple[List[Dict[str, Any]], "array[float]", "array[float]", "array[int]"],
+]
+
+
+def _build_alias(weights: "array[float]") -> Tuple["array[float]", "array[int]"]:
+    """Walker 别名法建表：O(n) 预处理换取之后每次 O(1) 权重抽取。
+
+    match_weights 在会话内不变，每个 req_key 的分布是静态的，
+    建表成本在整个会话里摊销后，单次抽取只剩一次随机下标 + 一次掷硬币。
+    """
+    n = len(weights)
+    total = sum(weights)
+    prob = array("d", (w * n / total for w in weights))
+    alias = array("l", [0] * n)
+    small = [i for i, p in enumerate(prob) if p < 1.0]
+    large = [i for i, p in enumerate(prob) if p >= 1.0]
+    while small and large:
+        s = small.pop()
+        g = large.pop()
+        alias[s] = g
+        prob[g] -= 1.0 - prob[s]
+        if prob[g] < 1.0:
+            small.append(g)
+        else:
+            large.append(g)
+    # 浮点误差留下的尾桶按满概率处理
+    for i in small:
+        prob[i] = 1.0
+    for i in large:
+        prob[i] = 1.0
+    return prob, alias
+
+
+def _tier_of(weight_value: float) -> str:
+    if weight_value >= 100:
+        return "SSR"
+    if weight_value >= 80:
+        return "SR"
+    if weight_value >= 60:
+        return "R"
+    return "N"
+
+
+def build_draw_index(items: List[Dict[str, Any]]) -> DrawIndex:
+    """
+    把 items 一次性整理为 req_key -> 候选池 的索引，抽签时免去全量扫描。
+
+    对每个 req_key：
+    - 仅收录 blind_safe == true 且 match_weights[req_key] > 0 的签文；
+    - 把「双重轮盘 + 分层卡池」摊平为一条等价分布：
+      每条签文的有效权重 = 所在档位的预设权重 / 档位内签文数，
+      先按档位轮盘、再在档位内等概率随机，与直接按有效权重抽取同分布；
+    - 对有效权重预建 Walker 别名表，单次抽签 O(1)。
+    """
+    buckets_by_key: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+    for item in items:
+        if not item.get("blind_safe", False):
+            continue
+        match_weights = item.get("match_weights") or {}
+        if not isinstance(match_weights, dict):
+            continue
+        for req_key, weight in match_weights.items():
+            try:
+                weight_value = float(weight)
+            except (TypeError, ValueError):
+                continue
+            if weight_value <= 0:
+                continue
+            buckets = buckets_by_key.setdefault(req_key, {})
+            buckets.setdefault(_tier_of(weight_value), []).append(item)
+
+    index: DrawIndex = {}
+    for req_key, buckets in buckets_by_key.items():
+        pool_items: List[Dict[str, Any]] = []
+        weights: List[float] = []
+        for tier_name, items_in_tier in buckets.items():
+            tier_weight = TIER_BASE_WEIGHTS.get(tier_name, 0.0)
+            if tier_weight <= 0:
+                continue
+            effective = tier_weight / len(items_in_tier)
+            pool_items.extend(items_in_tier)
+            weights.extend(effective for _ in items_in_tier)
+        if not pool_items:
+            continue
+        w_arr = array("d", weights)
+        prob, alias = _build_alias(w_arr)
+        index[req_key] = (pool_items, w_arr, prob, alias)
+    return index
+
+
 def weighted_random_choice(
     items_with_weight: List[Tuple[Dict[str, Any], float]]
 ) -> Dict[str, Any]:
-    total = sum(w for _, w in items_with_weight)
-    if total <= 0:
-        raise ValueError("权重总和必须大于 0。")
-    r = random.uniform(0, total)
-    cumulative = 0.0
+    """
+    在 (item, weight) 列表上执行一次权重抽取，返回选中的 item。要求 weight > 0。
+
+    采用 Efraimidis–Spirakis（A-ES）键值法：为每个候选生成键 log(u)/w 并保留
+    最大者，与权重轮盘赌同分布，但单次遍历即可完成，无需先求权重总和。
+    """
+    best_item: Dict[str, Any] | None = None
+    best_key = -math.inf
     for item, w in items_with_weight:
-        cumulative += w
-        if cumulative > r:
-            return item
-    return items_with_weight[-1][0]
+        if w <= 0:
+            continue
+        # 1 - random() 落在 (0, 1]，避免 log(0)
+        key = math.log(1.0 - random.random()) / w
+        if key > best_key:
+            best_key = key
+            best_item = item
+    if best_item is None:
+        raise ValueError("权重总和必须大于 0。")
+    return best_item
 
 
 def blind_draw_once(
-    items: List[Dict[str, Any]], req_key: str
+    source: DrawIndex | List[Dict[str, Any]], req_key: str
 ) -> Dict[str, Any] | None:
+    """
+    在给定 req_key 上执行一次盲抽。
+
+    source 既可以是 build_draw_index 预构建的索引（快路径：别名法 O(1)），
+    也可以是原始 items 列表（旧路径：逐条扫描 + 双重轮盘，结果同分布）。
+    """
+    if isinstance(source, dict):
+        pool = source.get(req_key)
+        if not pool:
+            return None
+        pool_items, _weights, prob, alias = pool
+        i = random.randrange(len(pool_items))
+        if random.random() >= prob[i]:
+            i = alias[i]
+        return pool_items[i]
+
+    items = source
     # 1. 收集候选并按分数分桶
     buckets: Dict[str, List[Dict[str, Any]]] = {
         "SSR": [],  # w >= 100
@@ -164,17 +352,11 @@ def blind_draw_once(
         return None
 
     # 2. 构造非空档位的「池子轮盘」
-    tier_base_weights: Dict[str, float] = {
-        "SSR": 75.0,
-        "SR": 15.0,
-        "R": 8.0,
-        "N": 2.0,
-    }
     tier_candidates: List[Tuple[str, float]] = []
     for tier_name, items_in_tier in buckets.items():
         if not items_in_tier:
             continue
-        tier_weight = tier_base_weights.get(tier_name, 0.0)
+        tier_weight = TIER_BASE_WEIGHTS.get(tier_name, 0.0)
         if tier_weight > 0:
             tier_candidates.append((tier_name, tier_weight))
 
@@ -196,8 +378,46 @@ def blind_draw_once(
     return random.choice(bucket_items)
 
 
+_FEEDBACK_ID_RE = re.compile(r'"feedback_id"\s*:\s*(\d+)')
+
+
+def _read_last_feedback_id(path: Path) -> int | None:
+    """从文件尾部按 4KB 块倒读，取最后一行完整记录里的 feedback_id。
+
+    日志按行追加、id 单调递增，因此尾行即最大 id；解析不出来返回 None。
+    """
+    try:
+        with path.open("rb") as f:
+            f.seek(0, os.SEEK_END)
+            pos = f.tell()
+            buf = b""
+            while pos > 0:
+                step = min(4096, pos)
+                pos -= step
+                f.seek(pos)
+                buf = f.read(step) + buf
+                # 末行之前已出现换行（或已读到文件头）时，末行必定完整
+                if pos == 0 or b"\n" in buf.rstrip(b"\r\n"):
+                    break
+            lines = [ln for ln in buf.splitlines() if ln.strip()]
+            if not lines:
+                return None
+            m = _FEEDBACK_ID_RE.search(lines[-1].decode("utf-8", errors="replace"))
+            return int(m.group(1)) if m else None
+    except OSError:
+        return None
+
+
 def get_next_feedback_id() -> int:
-    """从 feedback_log.jsonl 中计算下一条反馈的 feedback_id（自增）。"""
+    """从 feedback_log.jsonl 中计算下一条反馈的 feedback_id（自增）。
+
+    快路径：倒读尾部拿最后一条的 id + 1，免去整文件重读；
+    仅当尾部解析失败（如日志被手工编辑过）才退回整文件扫描。
+    """
+    if FEEDBACK_LOG_PATH.exists():
+        last_id = _read_last_feedback_id(FEEDBACK_LOG_PATH)
+        if last_id is not None:
+            return last_id + 1
     next_id = 1
     line_count = 0
     if FEEDBACK_LOG_PATH.exists():
@@ -225,24 +445,15 @@ def format_result(item: Dict[str, Any]) -> str:
     angle = item.get("angle", "")
     source = item.get("source", "")
 
-    lines = [
-        f"source：{source}",
-        f"index：{index}  angle：{angle}",
-        f"标题：{title}",
-        "",
-        "内容：",
-        text or "",
-        "",
-        "翻译：",
-        translation or "",
-        "",
-        "uimapping：",
-        ui_mapping or "",
-        "",
-        "微行动：",
-        ui_action or "",
-    ]
-    return "\n".join(lines)
+    return (
+        f"source：{source}\n"
+        f"index：{index}  angle：{angle}\n"
+        f"标题：{title}\n"
+        f"\n内容：\n{text or ''}\n"
+        f"\n翻译：\n{translation or ''}\n"
+        f"\nuimapping：\n{ui_mapping or ''}\n"
+        f"\n微行动：\n{ui_action or ''}"
+    )
 
 
 # 界面配色与字体（温暖、有层次、像工具）
@@ -276,6 +487,8 @@ class BlindDrawApp(tk.Tk):
 
         self.scenes = scenes
         self.items = items
+        # 启动时一次性构建 req_key -> 候选池 索引，抽签不再全量扫描 items
+        self.draw_index = build_draw_index(items)
 
         self.scene_order = [s for s in ["樊笼", "沉浮", "尘缘", "方寸"] if s in scenes]
 
@@ -292,6 +505,30 @@ class BlindDrawApp(tk.Tk):
         # 最近一次抽中的签文
         self.last_result_item: Dict[str, Any] | None = None
 
+        # 下一条反馈 id 的会话内缓存：首次提交时从日志算出，之后仅自增
+        self._next_feedback_id: int | None = None
+        # 反馈日志句柄：首次提交时打开（追加 + 行缓冲），整个会话复用
+        self._feedback_fh = None
+
+        # 级联清空下游选择时置 True，把多次 _update_req_key 合并成收尾一次
+        self._suppress_updates = False
+        # 上一次写入 Tk 的文案缓存：内容没变就不再走 Tcl 的 configure
+        self._last_req_key: str | None = None
+        self._last_option_text: Dict[str, str] = {}
+
+        # 每个大场景的「展示名 -> 内部名」映射与展示名列表只在启动时构建一次，
+        # 切换大场景时直接取引用，不再逐次切字符串、重建字典
+        self._disp_maps: Dict[str, Dict[str, str]] = {
+            scene: {
+                name.split("-", 1)[1] if "-" in name else name: name
+                for name in submap
+            }
+            for scene, submap in scenes.items()
+        }
+        self._disp_lists: Dict[str, List[str]] = {
+            scene: list(m.keys()) for scene, m in self._disp_maps.items()
+        }
+
         self.subscene_display_to_internal: Dict[str, str] = {}
 
         self._setup_styles()
@@ -346,6 +583,14 @@ class BlindDrawApp(tk.Tk):
         self.subscene_frame = ttk.LabelFrame(top_frame, text="第二步：选择子场景", padding=10)
         self.subscene_frame.grid(row=0, column=1, sticky=tk.W + tk.E + tk.N, padx=5, pady=5)
         self.subscene_buttons: Dict[str, tk.Radiobutton] = {}
+        # 子场景按钮池：只创建一次，切换大场景时 configure + grid 复用，
+        # 避免每次点击都 destroy/重建 Tk 控件
+        self._subscene_hint = ttk.Label(self.subscene_frame, text="请先在左侧选择大场景。")
+        self._subscene_hint.grid(row=0, column=0, sticky="w", pady=2)
+        self._subscene_pool: List[tk.Radiobutton] = []
+        self._ensure_subscene_pool(
+            max((len(submap) for submap in self.scenes.values()), default=0)
+        )
 
         # 第三步：A/B/C 短句选择
         option_frame = ttk.LabelFrame(top_frame, text="第三步：选择当前子场景下的 A/B/C", padding=10)
@@ -454,78 +699,92 @@ class BlindDrawApp(tk.Tk):
         )
         self._btn_confirm.pack(side=tk.RIGHT, padx=5)
 
-    def _on_scene_changed(self) -> None:
-        scene = self.var_scene.get()
-        subscene_map = self.scenes.get(scene, {})
-        subscene_names = list(subscene_map.keys())
-        display_names = [
-            name.split("-", 1)[1] if "-" in name else name for name in subscene_names
-        ]
-        self.subscene_internal_names = subscene_names
-        self.subscene_display_to_internal = {
-            disp: internal for disp, internal in zip(display_names, subscene_names)
-        }
-        # 清空并重建子场景按钮
-        for child in self.subscene_frame.winfo_children():
-            child.destroy()
-        self.subscene_buttons.clear()
-
-        if not display_names:
-            ttk.Label(self.subscene_frame, text="请先在左侧选择大场景。").grid(
-                row=0, column=0, sticky="w"
-            )
-            self.var_subscene.set("")
-            self._update_req_key()
-            return
-
-        ttk.Label(self.subscene_frame, text="请选择子场景：").grid(
-            row=0, column=0, sticky="w", pady=2
-        )
-        for i, (disp, internal) in enumerate(
-            zip(display_names, subscene_names), start=1
-        ):
+    def _ensure_subscene_pool(self, count: int) -> None:
+        """按需补足子场景按钮池，保证至少有 count 个可复用的单选按钮。"""
+        while len(self._subscene_pool) < count:
             rb = tk.Radiobutton(
                 self.subscene_frame,
-                text=disp,
+                text="",
                 variable=self.var_subscene,
-                value=disp,
+                value="",
                 anchor="w",
                 justify="left",
                 command=self._on_subscene_changed,
                 bg=BG_CARD, fg=FG_TEXT, selectcolor=BG_SELECT,
                 activebackground=BG_CARD, activeforeground=FG_TEXT,
             )
-            rb.grid(row=i, column=0, sticky="w", pady=2)
-            self.subscene_buttons[disp] = rb
+            self._subscene_pool.append(rb)
 
-        # 重置下游选择
-        self.var_subscene.set("")
-        self.var_option.set("")
-        self._update_req_key()
+    def _on_scene_changed(self) -> None:
+        scene = self.var_scene.get()
+        disp_map = self._disp_maps.get(scene, {})
+        display_names = self._disp_lists.get(scene, [])
+        self.subscene_internal_names = list(disp_map.values())
+        self.subscene_display_to_internal = disp_map
+        self._suppress_updates = True
+        try:
+            self.subscene_buttons.clear()
+
+            if not display_names:
+                self._subscene_hint.configure(text="请先在左侧选择大场景。")
+                for rb in self._subscene_pool:
+                    rb.grid_remove()
+                self.var_subscene.set("")
+                return
+
+            self._subscene_hint.configure(text="请选择子场景：")
+            self._ensure_subscene_pool(len(display_names))
+            for i, disp in enumerate(display_names, start=1):
+                rb = self._subscene_pool[i - 1]
+                rb.configure(text=disp, value=disp)
+                rb.grid(row=i, column=0, sticky="w", pady=2)
+                self.subscene_buttons[disp] = rb
+            # 多余的按钮摘下网格但不销毁，留待下次复用
+            for rb in self._subscene_pool[len(display_names):]:
+                rb.grid_remove()
+
+            # 重置下游选择
+            self.var_subscene.set("")
+            self.var_option.set("")
+        finally:
+            self._suppress_updates = False
+            self._update_req_key()
 
     def _on_subscene_changed(self) -> None:
         scene = self.var_scene.get()
         display_name = self.var_subscene.get()
         internal_name = self.subscene_display_to_internal.get(display_name)
-        if not scene or not internal_name:
-            # 清空 A/B/C 文案
+        self._suppress_updates = True
+        try:
+            if not scene or not internal_name:
+                # 清空 A/B/C 文案
+                for letter in ["A", "B", "C"]:
+                    self._set_option_text(letter, letter)
+                self.var_option.set("")
+                return
+
+            options = self.scenes.get(scene, {}).get(internal_name, {})
             for letter in ["A", "B", "C"]:
-                self.option_buttons[letter].configure(text=letter)
+                phrase = options.get(letter, "").strip()
+                text = f"{letter}：{phrase}" if phrase else letter
+                self._set_option_text(letter, text)
+
+            # 清空之前的 A/B/C 选择，由用户重新点选
             self.var_option.set("")
+        finally:
+            self._suppress_updates = False
             self._update_req_key()
-            return
-
-        options = self.scenes.get(scene, {}).get(internal_name, {})
-        for letter in ["A", "B", "C"]:
-            phrase = options.get(letter, "").strip()
-            text = f"{letter}：{phrase}" if phrase else letter
-            self.option_buttons[letter].configure(text=text)
 
-        # 清空之前的 A/B/C 选择，由用户重新点选
-        self.var_option.set("")
-        self._update_req_key()
+    def _set_option_text(self, letter: str, text: str) -> None:
+        """更新 A/B/C 按钮文案，内容未变时跳过 configure。"""
+        if self._last_option_text.get(letter) == text:
+            return
+        self.option_buttons[letter].configure(text=text)
+        self._last_option_text[letter] = text
 
     def _update_req_key(self) -> None:
+        if self._suppress_updates:
+            return
         scene = self.var_scene.get()
         display_name = self.var_subscene.get()
         internal_name = self.subscene_display_to_internal.get(display_name) if display_name else None
@@ -534,6 +793,9 @@ class BlindDrawApp(tk.Tk):
             req_key = f"{internal_name}_Option_{letter}"
         else:
             req_key = ""
+        if req_key == self._last_req_key:
+            return
+        self._last_req_key = req_key
         self.var_req_key.set(req_key)
         self.req_key_label.configure(text=f"当前路由键：{req_key}" if req_key else "当前路由键：")
 
@@ -543,7 +805,7 @@ class BlindDrawApp(tk.Tk):
         if not req_key:
             messagebox.showwarning("提示", "请选择完整的大场景、子场景和短句（A/B/C）。")
             return
-        result = blind_draw_once(self.items, req_key)
+        result = blind_draw_once(self.draw_index, req_key)
         if result is None:
             messagebox.showinfo(
                 "无可用签文",
@@ -555,6 +817,20 @@ class BlindDrawApp(tk.Tk):
         self.text_result.delete("1.0", tk.END)
         self.text_result.insert(tk.END, formatted)
 
+    def _feedback_file(self):
+        """惰性打开反馈日志（追加 + 行缓冲），跨多次提交复用同一句柄。
+
+        行缓冲保证每条记录写完即落到内核，免去每次点击 open/close 的开销；
+        进程退出时由 atexit 统一关闭。
+        """
+        if self._feedback_fh is None:
+            FEEDBACK_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+            self._feedback_fh = FEEDBACK_LOG_PATH.open(
+                "a", encoding="utf-8", buffering=1
+            )
+            atexit.register(self._feedback_fh.close)
+        return self._feedback_fh
+
     def on_save_feedback(self) -> None:
         if not self.last_result_item:
             messagebox.showwarning("提示", "请先抽一签，再记录反馈。")
@@ -578,7 +854,9 @@ class BlindDrawApp(tk.Tk):
         blind_safe_suggestion = str(blind_safe_raw).strip().lower() == "true"
         comment = self.text_comment.get("1.0", tk.END).strip()
 
-        feedback_id = get_next_feedback_id()
+        feedback_id = self._next_feedback_id
+        if feedback_id is None:
+            feedback_id = get_next_feedback_id()
         record = {
             "feedback_id": feedback_id,
             "source": source,
@@ -593,27 +871,29 @@ class BlindDrawApp(tk.Tk):
         }
 
         try:
-            FEEDBACK_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
-            with FEEDBACK_LOG_PATH.open("a", encoding="utf-8") as f:
-                f.write(json.dumps(record, ensure_ascii=False))
-                f.write("\n")
+            fh = self._feedback_file()
+            if orjson is not None:
+                fh.write(orjson.dumps(record).decode("utf-8") + "\n")
+            else:
+                fh.write(json.dumps(record, ensure_ascii=False) + "\n")
         except Exception as e:
             messagebox.showerror("错误", f"保存反馈失败：{e}")
             return
 
+        self._next_feedback_id = feedback_id + 1
         messagebox.showinfo("成功", "反馈已记录到 feedback_log.jsonl。")
         self.text_comment.delete("1.0", tk.END)
 
 
 def main() -> None:
     try:
-        scenes = load_system_prompts(SYSTEM_PROMPT_PATH)
+        scenes = _load_cached(SYSTEM_PROMPT_PATH, load_system_prompts)
     except Exception as e:
         messagebox.showerror("错误", f"解析系统提示词失败：{e}")
         return
 
     try:
-        items = load_text_material_items(TEXT_MATERIAL_PATH)
+        items = _load_cached(TEXT_MATERIAL_PATH, load_text_material_items)
     except Exception as e:
         messagebox.showerror("错误", f"加载 textMaterial.json 失败：{e}")
         return
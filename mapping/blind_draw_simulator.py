@@ -13,7 +13,7 @@
   - 第 2 重：在选定池子中对候选签文做等概率随机，返回 1 条签文。
 
 依赖：
-- 标准库：json, os, pathlib, random, re, sys
+- 标准库：array, bisect, itertools, json, os, pathlib, random, sys
 - 数据文件：
   - ../tanjing.json
   - ../系统提示词.md
@@ -21,11 +21,18 @@
 
 from __future__ import annotations
 
+import bisect
 import json
 import os
 import random
-import re
 import sys
+from array import array
+from itertools import accumulate
+
+try:
+    import orjson
+except ImportError:  # orjson 未安装时退回标准库 json
+    orjson = None
 from pathlib import Path
 from typing import Dict, List, Tuple, Any
 
@@ -34,6 +41,10 @@ MAPPING_DIR = ROOT_DIR / "mapping"
 TEXT_MATERIAL_PATH = ROOT_DIR / "text" / "textMaterial.json"
 SYSTEM_PROMPT_PATH = ROOT_DIR / "系统提示词.md"
 
+# 行级解析不走正则：三类行的定界符都是固定前缀
+# （"N. 【…】" / "樊笼-xxx：" / "Option_A（…）：…"），
+# 用 startswith / partition 直接切分即可，比 SRE 引擎快且零 Match 对象分配
+
 
 def load_system_prompts(path: Path) -> Dict[str, Dict[str, Dict[str, str]]]:
     """
@@ -58,39 +69,39 @@ def load_system_prompts(path: Path) -> Dict[str, Dict[str, Dict[str, str]]]:
     if not path.is_file():
         raise FileNotFoundError(f"未找到系统提示词文件：{path}")
 
-    big_scene_pattern = re.compile(r"^\d+\.\s*【(.+?)】")
-    # 例如：樊笼-形如槁木：
-    subscene_pattern = re.compile(r"^([^\s]+-[^：]+)：")
-    # 例如：Option_A（贪）：仰高不及，颓卧尘埃。
-    option_pattern = re.compile(r"^Option_([ABC])[（(].*?[）)][:：]\s*(.+)$")
-
-    with path.open("r", encoding="utf-8") as f:
-        for raw_line in f:
-            line = raw_line.strip()
-            if not line:
-                continue
-
-            m_big = big_scene_pattern.match(line)
-            if m_big:
-                current_scene = m_big.group(1)
+    # 提示词文件很小，一次读入后在内存里迭代，免去逐行 readline 开销；
+    # filter(None, ...) 在 C 迭代层剔掉空行
+    lines = path.read_text(encoding="utf-8").splitlines()
+    for line in filter(None, map(str.strip, lines)):
+        # 大场景行："1. 【樊笼】……"
+        if line[:1].isdigit() and "【" in line:
+            name = line.partition("【")[2].partition("】")[0]
+            if name:
+                current_scene = name
                 scenes.setdefault(current_scene, {})
                 current_subscene = None
-                continue
+            continue
 
-            m_sub = subscene_pattern.match(line)
-            if m_sub and current_scene:
-                candidate = m_sub.group(1)
-                # 确保前缀与当前大场景一致，例如 "樊笼-形如槁木" 以 "樊笼-" 开头
-                if candidate.startswith(current_scene + "-"):
-                    current_subscene = candidate
-                    scenes[current_scene].setdefault(current_subscene, {})
-                continue
+        # Option 行："Option_A（贪）：仰高不及，颓卧尘埃。"
+        if line.startswith("Option_"):
+            if current_scene and current_subscene:
+                letter = line[7:8]
+                if letter in ("A", "B", "C") and line[8:9] in ("（", "("):
+                    _, sep, tail = line.partition("：")
+                    if not sep:
+                        _, sep, tail = line.partition(":")
+                    phrase = tail.strip()
+                    if sep and phrase:
+                        scenes[current_scene][current_subscene][letter] = phrase
+            continue
 
-            m_opt = option_pattern.match(line)
-            if m_opt and current_scene and current_subscene:
-                letter = m_opt.group(1)
-                phrase = m_opt.group(2).strip()
-                scenes[current_scene][current_subscene][letter] = phrase
+        # 子场景行："樊笼-形如槁木：……"
+        # 确保前缀与当前大场景一致，例如 "樊笼-形如槁木" 以 "樊笼-" 开头
+        if current_scene:
+            head, sep, _ = line.partition("：")
+            if sep and head.startswith(current_scene + "-"):
+                current_subscene = head
+                scenes[current_scene].setdefault(current_subscene, {})
 
     return scenes
 
@@ -99,8 +110,12 @@ def load_text_material_items(path: Path) -> List[Dict[str, Any]]:
     if not path.is_file():
         raise FileNotFoundError(f"未找到数据文件：{path}")
 
-    with path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
+    # orjson 解析大 JSON 比标准库快数倍，直接吃 bytes 还省一次 UTF-8 解码
+    if orjson is not None:
+        data = orjson.loads(path.read_bytes())
+    else:
+        with path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
 
     if not isinstance(data, list):
         raise ValueError("textMaterial.json 顶层结构应为列表。")
@@ -115,10 +130,14 @@ def choose_from_menu(title: str, options: List[str]) -> int:
     if not options:
         raise ValueError(f"{title} 选项为空。")
 
+    # 菜单文本一次拼好、一次写出（write + flush 比 print 少一层分发），
+    # 避免每个选项各起一次 print
+    menu = "\n".join(
+        [f"\n{title}"] + [f"{i}. {opt}" for i, opt in enumerate(options, start=1)]
+    ) + "\n"
     while True:
-        print(f"\n{title}")
-        for i, opt in enumerate(options, start=1):
-            print(f"{i}. {opt}")
+        sys.stdout.write(menu)
+        sys.stdout.flush()
         choice = input("请输入序号（数字）：").strip()
         if not choice.isdigit():
             print("输入无效，请输入数字序号。")
@@ -129,146 +148,167 @@ def choose_from_menu(title: str, options: List[str]) -> int:
         print("序号超出范围，请重新输入。")
 
 
-def build_req_key(
+# 保证按 A/B/C 顺序展示
+OPTION_LETTERS = ("A", "B", "C")
+
+
+def build_menu_cache(
     scenes: Dict[str, Dict[str, Dict[str, str]]]
+) -> Dict[str, Tuple[List[str], List[str], Dict[str, List[str]]]]:
+    """
+    预计算交互菜单用的展示数据，返回
+    {scene: (子场景内部名列表, 子场景展示名列表, {子场景: OptionA/B/C 标签})}。
+
+    菜单在 REPL 循环里反复展示，展示名切分与标签拼接只做这一次。
+    """
+    cache: Dict[str, Tuple[List[str], List[str], Dict[str, List[str]]]] = {}
+    for scene_name, subscene_map in scenes.items():
+        subscene_names = list(subscene_map.keys())
+        # 为展示更友好，可去掉前缀中的大场景名，仅展示后半部分
+        display_subscenes = [
+            name.split("-", 1)[1] if "-" in name else name for name in subscene_names
+        ]
+        option_labels: Dict[str, List[str]] = {}
+        for sub, options in subscene_map.items():
+            labels = []
+            for letter in OPTION_LETTERS:
+                phrase = options.get(letter, "").strip()
+                labels.append(f"{letter}：{phrase}" if phrase else letter)
+            option_labels[sub] = labels
+        cache[scene_name] = (subscene_names, display_subscenes, option_labels)
+    return cache
+
+
+def build_req_key(
+    menu_cache: Dict[str, Tuple[List[str], List[str], Dict[str, List[str]]]]
 ) -> Tuple[str, str, str]:
     """
     引导用户进行三层选择，并返回 (scene_name, subscene_name, req_key)。
+    菜单文案全部来自 build_menu_cache 的预计算结果。
     """
     # 固定大场景顺序，若某一项在解析结果中不存在则自动跳过
     scene_order = ["樊笼", "沉浮", "尘缘", "方寸"]
-    available_scenes = [s for s in scene_order if s in scenes]
+    available_scenes = [s for s in scene_order if s in menu_cache]
     scene_idx = choose_from_menu("请选择大场景：", available_scenes)
     scene_name = available_scenes[scene_idx]
 
-    subscene_map = scenes[scene_name]
-    subscene_names = list(subscene_map.keys())
-    # 为展示更友好，可去掉前缀中的大场景名，仅展示后半部分
-    display_subscenes = [
-        name.split("-", 1)[1] if "-" in name else name for name in subscene_names
-    ]
+    subscene_names, display_subscenes, option_labels = menu_cache[scene_name]
     sub_idx = choose_from_menu(
         f"【{scene_name}】下的子场景（12 基础标签的一部分）：", display_subscenes
     )
     subscene_name = subscene_names[sub_idx]
 
-    options = subscene_map[subscene_name]
-    # 保证按 A/B/C 顺序展示
-    option_letters = ["A", "B", "C"]
-    option_labels = []
-    for letter in option_letters:
-        phrase = options.get(letter, "").strip()
-        label = f"{letter}：{phrase}" if phrase else letter
-        option_labels.append(label)
-
     opt_idx = choose_from_menu(
-        f"【{subscene_name}】下的 3 个心理维度短句（对应 Option A/B/C）：", option_labels
+        f"【{subscene_name}】下的 3 个心理维度短句（对应 Option A/B/C）：",
+        option_labels[subscene_name],
     )
-    selected_letter = option_letters[opt_idx]
+    selected_letter = OPTION_LETTERS[opt_idx]
     req_key = f"{subscene_name}_Option_{selected_letter}"
 
     return scene_name, subscene_name, req_key
 
 
-def weighted_random_choice(
-    items_with_weight: List[Tuple[Dict[str, Any], float]]
-) -> Dict[str, Any]:
-    """
-    在 (item, weight) 列表上执行一次权重轮盘赌，返回选中的 item。
-    要求所有 weight > 0。
-    """
-    total = sum(w for _, w in items_with_weight)
-    if total <= 0:
-        raise ValueError("权重总和必须大于 0。")
-    r = random.uniform(0, total)
-    cumulative = 0.0
-    for item, w in items_with_weight:
-        cumulative += w
-        if cumulative > r:
-            return item
-    # 理论上不会走到这里，但为了安全，返回最后一个
-    return items_with_weight[-1][0]
+# 第 1 重轮盘中四个档位的预设权重
+TIER_BASE_WEIGHTS = {
+    "SSR": 75.0,  # w >= 100
+    "SR": 15.0,   # 80 <= w < 100
+    "R": 8.0,     # 60 <= w < 80
+    "N": 2.0,     # 0 < w < 60
+}
 
 
-def blind_draw_once(
-    items: List[Dict[str, Any]], req_key: str
-) -> Dict[str, Any] | None:
-    """
-    依据盲抽规则，在给定 req_key 上执行一次抽取：
-    - 仅使用 blind_safe == true 且 match_weights[req_key] > 0 的签文。
-    - 采用「双重轮盘 + 分层卡池」：
-      1）按权重 w 将候选签文分入四个档位（SSR/SR/R/N）；
-      2）在非空档位之间按预设权重 (75/15/8/2) 做第 1 重轮盘，选出档位；
-      3）在该档位内部做等概率随机，选出最终签文。
-    - 若无任何候选，则返回 None。
+def preprocess_items(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
-    # 1. 收集候选并按分数分桶
-    buckets = {
-        "SSR": [],  # w >= 100
-        "SR": [],   # 80 <= w < 100
-        "R": [],    # 60 <= w < 80
-        "N": [],    # 0 < w < 60
-    }
+    启动时一次性预处理候选签文：
+    - 丢弃非 blind_safe 或 match_weights 结构非法的签文；
+    - 把 match_weights 的值统一强转为 float，剔除非法 / 非正的权重，
+      并对非法值打一条警告。
 
+    之后建索引、抽签都不再需要逐项 isinstance 检查和 try/except 强转。
+    """
+    safe_items: List[Dict[str, Any]] = []
     for item in items:
         if not item.get("blind_safe", False):
             continue
         match_weights = item.get("match_weights") or {}
         if not isinstance(match_weights, dict):
             continue
-        weight = match_weights.get(req_key, 0)
-        try:
-            weight_value = float(weight)
-        except (TypeError, ValueError):
-            continue
-        if weight_value <= 0:
-            continue
-        if weight_value >= 100:
-            buckets["SSR"].append(item)
-        elif weight_value >= 80:
-            buckets["SR"].append(item)
-        elif weight_value >= 60:
-            buckets["R"].append(item)
-        else:
-            buckets["N"].append(item)
+        cleaned: Dict[str, float] = {}
+        for key, weight in match_weights.items():
+            try:
+                weight_value = float(weight)
+            except (TypeError, ValueError):
+                print(
+                    f"警告：签文「{item.get('title', '')}」的权重 {key}={weight!r} 非法，已忽略。",
+                    file=sys.stderr,
+                )
+                continue
+            if weight_value > 0:
+                cleaned[key] = weight_value
+        item["match_weights"] = cleaned
+        safe_items.append(item)
+    return safe_items
 
-    # 若四个桶全为空，则本次无可用签文
-    if not any(buckets.values()):
-        return None
 
-    # 2. 构造非空档位的「池子轮盘」
-    tier_base_weights = {
-        "SSR": 75.0,
-        "SR": 15.0,
-        "R": 8.0,
-        "N": 2.0,
-    }
-    tier_candidates: List[Tuple[str, float]] = []
-    for tier_name, items_in_tier in buckets.items():
-        if not items_in_tier:
-            continue
-        tier_weight = tier_base_weights.get(tier_name, 0.0)
-        if tier_weight > 0:
-            tier_candidates.append((tier_name, tier_weight))
+def build_draw_index(
+    safe_items: List[Dict[str, Any]]
+) -> Dict[str, Tuple[List[Dict[str, Any]], "array[float]"]]:
+    """
+    一次性扫描 preprocess_items 处理过的签文，为每个 req_key 预构建
+    候选池，返回 {req_key: (候选列表, 有效权重的前缀和)}。
 
-    # 理论上只要有候选，就至少有一个非空档位
-    if not tier_candidates:
-        return None
+    有效权重 = 档位权重 / 档内候选数。先按 75/15/8/2 抽档位、再在档内
+    等概率随机，与直接按有效权重做一重轮盘的分布完全相同——这里把
+    「双重轮盘 + 分层卡池」摊平成一重，换来 O(1) 的按键查找；前缀和
+    建好后每次抽取只剩一次二分查找。
+    """
+    per_key_buckets: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+    for item in safe_items:
+        for key, weight_value in item["match_weights"].items():
+            if weight_value >= 100:
+                tier = "SSR"
+            elif weight_value >= 80:
+                tier = "SR"
+            elif weight_value >= 60:
+                tier = "R"
+            else:
+                tier = "N"
+            per_key_buckets.setdefault(key, {}).setdefault(tier, []).append(item)
+
+    index: Dict[str, Tuple[List[Dict[str, Any]], "array[float]"]] = {}
+    for key, buckets in per_key_buckets.items():
+        pool: List[Dict[str, Any]] = []
+        weights: List[float] = []
+        for tier, members in buckets.items():
+            effective = TIER_BASE_WEIGHTS[tier] / len(members)
+            pool.extend(members)
+            weights.extend([effective] * len(members))
+        # 前缀和存成紧凑的 C double 数组（SoA），二分时缓存局部性更好
+        index[key] = (pool, array("d", accumulate(weights)))
+    return index
 
-    # 第 1 重轮盘：在档位之间按预设权重抽取池子
-    chosen_tier = weighted_random_choice(tier_candidates)
 
-    # 第 2 重轮盘：在选定池子中做等概率随机
-    bucket_items = buckets.get(chosen_tier, [])
-    if not bucket_items:
-        # 极端情况下兜底：退化为在所有候选上等概率随机
-        all_items: List[Dict[str, Any]] = []
-        for v in buckets.values():
-            all_items.extend(v)
-        if not all_items:
-            return None
-        return random.choice(all_items)
-    return random.choice(bucket_items)
+def blind_draw_once(
+    draw_index: Dict[str, Tuple[List[Dict[str, Any]], "array[float]"]], req_key: str
+) -> Dict[str, Any] | None:
+    """
+    在 build_draw_index 预构建的索引上，对给定 req_key 执行一次抽取。
+
+    候选池已按「双重轮盘 + 分层卡池」的有效权重摊平，前缀和也在建索引
+    时算好，这里只剩一次 bisect 二分查找；若该键下无候选，则返回 None。
+    """
+    entry = draw_index.get(req_key)
+    if not entry:
+        return None
+    pool, cum = entry
+    if not cum:
+        return None
+    # 直接 bisect 省掉 random.choices 的参数检查开销；本仓库单键候选至多
+    # 几十条，引入 numpy 做向量化只会多一笔导入/转换开销，收益为零
+    i = bisect.bisect_right(cum, random.random() * cum[-1])
+    if i >= len(pool):
+        i = len(pool) - 1
+    return pool[i]
 
 
 def print_result(item: Dict[str, Any]) -> None:
@@ -283,15 +323,25 @@ def print_result(item: Dict[str, Any]) -> None:
     index = item.get("index", "")
     angle = item.get("angle", "")
 
-    print("\n=== 抽签结果 ===")
-    print(f"source：{item.get('source', '')}")
-    print(f"index：{index}  angle：{angle}")
-    print(f"标题：{title}")
-    print(f"内容：\n{text}")
-    print(f"\n翻译：\n{translation}")
-    print(f"\nuimapping：\n{ui_mapping}")
-    print(f"\n微行动：\n{ui_action}")
-    print("================\n")
+    # 整块文本一次输出，减少 stdout 锁与系统调用次数
+    print(
+        f"""\n=== 抽签结果 ===
+source：{item.get('source', '')}
+index：{index}  angle：{angle}
+标题：{title}
+内容：
+{text}
+
+翻译：
+{translation}
+
+uimapping：
+{ui_mapping}
+
+微行动：
+{ui_action}
+================\n"""
+    )
 
 
 def main() -> None:
@@ -311,11 +361,16 @@ def main() -> None:
         print(f"加载 textMaterial.json 失败：{e}", file=sys.stderr)
         sys.exit(1)
 
+    # 进入交互循环前一次性预处理并建好 req_key -> 候选池 索引，抽签不再全量扫描；
+    # 菜单展示数据同样只算一次
+    draw_index = build_draw_index(preprocess_items(items))
+    menu_cache = build_menu_cache(scenes)
+
     while True:
-        scene_name, subscene_name, req_key = build_req_key(scenes)
+        scene_name, subscene_name, req_key = build_req_key(menu_cache)
         print(f"\n当前路由键：{req_key}")
 
-        result = blind_draw_once(items, req_key)
+        result = blind_draw_once(draw_index, req_key)
         if result is None:
             print("在该键上未找到任何 blind_safe 且权重 > 0 的签文。")
         else:
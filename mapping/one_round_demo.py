@@ -28,6 +28,7 @@ from blind_draw_gui import (
     SYSTEM_PROMPT_PATH,
     TANJING_PATH,
     blind_draw_once,
+    build_draw_index,
     format_result,
     load_system_prompts,
     load_tanjing_items,
@@ -43,15 +44,18 @@ from lm_studio_smoke_test import (
 
 
 # ---------- 36 维路由键列表（供 LLM 选择） ----------
-def build_req_keys_text(scenes: dict) -> tuple[list[str], str]:
-    """从 load_system_prompts 结果生成合法 req_key 列表与供 LLM 阅读的文本。"""
-    valid_keys: list[str] = []
+def build_req_keys_text(scenes: dict) -> tuple[set[str], str]:
+    """从 load_system_prompts 结果生成合法 req_key 集合与供 LLM 阅读的文本。
+
+    返回集合而非列表：合法性校验是成员判断，set 查找 O(1)。
+    """
+    valid_keys: set[str] = set()
     lines: list[str] = []
     for big, subscenes in scenes.items():
         for sub, opts in subscenes.items():
             for letter in "ABC":
                 key = f"{sub}_Option_{letter}"
-                valid_keys.append(key)
+                valid_keys.add(key)
                 phrase = (opts or {}).get(letter, "")
                 lines.append(f"{key}  {phrase}")
     return valid_keys, "\n".join(lines)
@@ -224,6 +228,18 @@ _FEEDBACK_LINE_RE = re.compile(
     re.IGNORECASE,
 )
 
+# 兜底：整段中首次出现的四元组（应对无换行或重复多段）
+_FEEDBACK_ANYWHERE_RE = re.compile(
+    r"([1-5])\s*,\s*([1-5])\s*,\s*(true|false)\s*,\s*([^\n]+?)(?:\s*$|\s*我将|\s*好的|\s*{\")",
+    re.IGNORECASE,
+)
+
+# extract_json / _normalize_feedback_value 用到的模式，模块加载时编译一次
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*([\s\S]*?)\s*```")
+_TRAILING_ELLIPSIS_RE = re.compile(r",?\s*\.{3}\s*$")
+_BRACE_BLOCK_RE = re.compile(r"\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}")
+_INT_MARKER_RE = re.compile(r"\s*\(int\)\s*")
+
 
 def parse_feedback_line(text: str) -> dict | None:
     """从回复中找符合「数字,数字,true|false,comment」的一行或片段，解析为反馈 dict。"""
@@ -237,12 +253,7 @@ def parse_feedback_line(text: str) -> dict | None:
         m = _FEEDBACK_LINE_RE.match(line)
         if m:
             return _feedback_match_to_dict(m)
-    # 兜底：整段中首次出现四元组（应对无换行或重复多段）
-    m = re.search(
-        r"([1-5])\s*,\s*([1-5])\s*,\s*(true|false)\s*,\s*([^\n]+?)(?:\s*$|\s*我将|\s*好的|\s*{\")",
-        text,
-        re.IGNORECASE,
-    )
+    m = _FEEDBACK_ANYWHERE_RE.search(text)
     if m:
         return _feedback_match_to_dict(m)
     return None
@@ -273,7 +284,7 @@ def _normalize_feedback_value(obj: dict) -> None:
         if isinstance(v, (int, float)):
             obj[key] = max(1, min(5, int(round(v))))
         elif isinstance(v, str):
-            v = re.sub(r"\s*\(int\)\s*", "", v).strip()
+            v = _INT_MARKER_RE.sub("", v).strip()
             try:
                 obj[key] = max(1, min(5, int(round(float(v)))))
             except (ValueError, TypeError):
@@ -294,10 +305,10 @@ def extract_json(reply: str) -> dict | None:
     candidates: list[tuple[int, dict]] = []  # (required_keys_count, obj)
 
     # 1) 收集所有 ```json ... ``` 块
-    for m in re.finditer(r"```(?:json)?\s*([\s\S]*?)\s*```", raw):
+    for m in _JSON_FENCE_RE.finditer(raw):
         block = m.group(1).strip()
         # 去掉块内明显推理尾缀（如 "Final decision."）
-        block = re.sub(r",?\s*\.{3}\s*$", "", block)
+        block = _TRAILING_ELLIPSIS_RE.sub("", block)
         try:
             obj = json.loads(block)
             if isinstance(obj, dict):
@@ -308,7 +319,7 @@ def extract_json(reply: str) -> dict | None:
             pass
 
     # 2) 收集所有 {...} 块（避免贪婪匹配到超长）
-    for m in re.finditer(r"\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}", raw):
+    for m in _BRACE_BLOCK_RE.finditer(raw):
         try:
             obj = json.loads(m.group(0))
             if isinstance(obj, dict):
@@ -385,6 +396,7 @@ def main() -> int:
     scenes = load_system_prompts(SYSTEM_PROMPT_PATH)
     valid_req_keys, req_keys_text = build_req_keys_text(scenes)
     items = load_tanjing_items(TANJING_PATH)
+    draw_index = build_draw_index(items)
 
     # ---------- Step 1: LLM 写一个场景（Python 强制随机类别，防分布惰性）----------
     print("--- Step 1: LLM 生成场景 ---", flush=True)
@@ -419,7 +431,7 @@ def main() -> int:
 
     # ---------- Step 3: 盲抽一次 ----------
     print("--- Step 3: 盲抽一次签 ---", flush=True)
-    drawn = blind_draw_once(items, req_key)
+    drawn = blind_draw_once(draw_index, req_key)
     if not drawn:
         print("该 req_key 下无候选签文（blind_safe 且 match_weights 无正权重）。", file=sys.stderr)
         return 1
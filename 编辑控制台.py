@@ -6,9 +6,22 @@
 import json
 import os
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # orjson 未安装时退回标准库 json
+    orjson = None
 from tkinter import ttk, messagebox
 from tkinter.scrolledtext import ScrolledText
 
+# 标准库兜底路径复用同一套编解码器实例，免去每次 dumps/loads
+# 重新构造并解析参数的开销（条目都是纯 dict，关掉循环检测也安全）
+_ENC = json.JSONEncoder(
+    ensure_ascii=False, indent=2, check_circular=False, allow_nan=False
+).encode
+_DEC = json.JSONDecoder().decode
+
 # 工程根目录下的 text/textMaterial.json（以当前脚本所在目录为根）
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 TEXT_MATERIAL_PATH = os.path.join(SCRIPT_DIR, "text", "textMaterial.json")
@@ -46,18 +59,58 @@ SHORT_FIELDS = {
     "angle",
 }
 
+# 结构化字段的原生类型：渲染成文本、读回时解析还原，避免 dict / bool
+# 被 str() 串化后写回文件（ui_mapping 等在现有数据里是纯文本，不在此列）
+FIELD_TYPES = {
+    "blind_safe": "bool",
+    "match_weights": "json",
+}
+
 
 def load_json():
     path = TEXT_MATERIAL_PATH
     if not os.path.exists(path):
         raise FileNotFoundError(f"未找到文件：{path}")
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    fd = os.open(path, os.O_RDONLY)
+    # 整文件只顺序读一遍：提示内核放大预读窗口，少等几次盘
+    # （posix_fadvise 仅 Linux 等平台有，其余平台静默跳过）
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    with os.fdopen(fd, "rb") as f:
+        raw = f.read()
+    # orjson 直接吃 bytes，解析比标准库快数倍
+    if orjson is not None:
+        return orjson.loads(raw)
+    return _DEC(raw.decode("utf-8"))
+
+
+def _serialize(data):
+    # 整体先序列化成 bytes：省去 json.dump 逐片段 write 的 Python 层蹦床
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return _ENC(data).encode("utf-8")
+
+
+def _write_atomic(buf):
+    # 写临时文件 + 原子替换，崩溃不会留下半截文件
+    tmp = TEXT_MATERIAL_PATH + ".tmp"
+    with open(tmp, "wb", buffering=1 << 20) as f:
+        f.write(buf)
+    os.replace(tmp, TEXT_MATERIAL_PATH)
 
 
 def save_json(data):
-    with open(TEXT_MATERIAL_PATH, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    _write_atomic(_serialize(data))
+
+
+def _entry_hash(entry):
+    """条目内容指纹：序列化字节求 hash，用于判断是否真的改过。"""
+    try:
+        if orjson is not None:
+            return hash(orjson.dumps(entry, option=orjson.OPT_SORT_KEYS))
+        return hash(json.dumps(entry, ensure_ascii=False, sort_keys=True))
+    except (TypeError, ValueError):
+        return object()  # 序列化失败时视为总是「已修改」
 
 
 class EditorApp:
@@ -69,7 +122,20 @@ class EditorApp:
 
         self.data = []  # list of dict
         self.current_index = 0
+        self._title_index = {}  # title -> 条目下标，查找时免线性扫描
+        self._by_tag = {}  # tag -> 条目下标，下拉直跳用
+        self.tag_combo = None  # 顶部 tag 跳转下拉框
+        self._rendered = {}  # field -> 控件当前显示内容，未变化的字段跳过重写
+        self._json_cache = {}  # id(条目) -> 整签 JSON 序列化文本，条目未变时复用
+        self._json_rendered = None  # JSON 页文本框当前显示的串，相同则免重绘
+        self._dirty = False  # 只有真实编辑置脏；干净时导航不再整文件落盘
+        self._dirty_fields = set()  # 本条内被用户动过的字段，同步时只读这些控件
+        self._io_pool = ThreadPoolExecutor(max_workers=1)  # 落盘专用后台线程
+        self._baseline_hash = []  # 各条目落盘时的内容指纹，脏标记误报时兜底
+        self._write_failed = False  # 上次写盘失败：基线不可信，指纹短路停用
+        self._rendering = False  # 程序性刷新控件期间屏蔽 <<Modified>> 误报
         self.widgets = {}  # field_name -> widget (Entry or Text)
+        self._field_vars = {}  # field_name -> StringVar（单行字段脏跟踪）
         self.notebook = None
         self.json_text = None  # 整签 JSON 页的文本框
 
@@ -98,7 +164,13 @@ class EditorApp:
         self.search_entry.pack(side=tk.LEFT)
         ttk.Button(top, text="查找", command=self._search_by_sutra_title).pack(side=tk.LEFT, padx=(2, 8))
 
-        ttk.Button(top, text="保存到 textMaterial.json", command=self._save).pack(side=tk.LEFT, padx=2)
+        # 按 tag 直跳：下拉里选中即 O(1) 定位，无需线性扫描
+        ttk.Label(top, text="tag：").pack(side=tk.LEFT, padx=(4, 2))
+        self.tag_combo = ttk.Combobox(top, width=16, state="readonly")
+        self.tag_combo.pack(side=tk.LEFT)
+        self.tag_combo.bind("<<ComboboxSelected>>", self._goto_tag)
+
+        ttk.Button(top, text="保存到 textMaterial.json", command=lambda: self._save(force=True)).pack(side=tk.LEFT, padx=2)
         ttk.Button(top, text="删除当前条目", command=self._delete_current_entry).pack(side=tk.LEFT, padx=2)
         ttk.Button(top, text="新增条目", command=self._add_entry).pack(side=tk.LEFT, padx=2)
         ttk.Separator(self.root, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=2)
@@ -114,10 +186,6 @@ class EditorApp:
         canvas = tk.Canvas(frame_form, highlightthickness=0)
         scrollbar = ttk.Scrollbar(frame_form, orient=tk.VERTICAL, command=canvas.yview)
         self.frame = ttk.Frame(canvas)
-        self.frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all")),
-        )
         canvas.create_window((0, 0), window=self.frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -126,29 +194,58 @@ class EditorApp:
         def _on_mousewheel(event):
             canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
 
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
-
-        for key, label in FIELDS:
+        # 仅在指针位于表单画布上时接管全局滚轮，离开即解绑，
+        # 避免常驻 bind_all 让别的控件滚动时也触发整表重绘
+        canvas.bind("<Enter>", lambda e: canvas.bind_all("<MouseWheel>", _on_mousewheel))
+        canvas.bind("<Leave>", lambda e: canvas.unbind_all("<MouseWheel>"))
+        # 窗口失焦时指针可能仍停在画布上、<Leave> 不会触发，这里兜底解绑。
+        # 子控件间的焦点切换也会沿 bindtags 冒到根窗口，只认根窗口
+        # 自己的 FocusOut，否则在表单内点来点去就把滚轮误杀了
+        def _on_window_focus_out(event):
+            if event.widget is self.root:
+                canvas.unbind_all("<MouseWheel>")
+
+        self.root.bind("<FocusOut>", _on_window_focus_out)
+
+        # 行统一用 grid 摆放：pack 逐行追加每次都触发一轮布局失效，
+        # grid 的行配置会合并到最后的 update_idletasks 一次算完
+        self.frame.grid_columnconfigure(0, weight=1)
+        for i, (key, label) in enumerate(FIELDS):
             row = ttk.Frame(self.frame, padding=4)
-            row.pack(fill=tk.X)
+            row.grid(row=i, column=0, sticky="ew")
             ttk.Label(row, text=label, width=22, anchor="nw").pack(side=tk.LEFT, anchor="nw", padx=(0, 8))
             if key in SHORT_FIELDS:
-                w = ttk.Entry(row, width=80)
+                # 用 StringVar 的 trace 盯写入：<KeyRelease> 捕不到中键
+                # 粘贴等 Tk 内置绑定；程序性填充由 _rendering 屏蔽
+                var = tk.StringVar()
+                var.trace_add("write", lambda *args, k=key: self._mark_dirty(field=k))
+                self._field_vars[key] = var  # 持引用，防止 Tk 变量被回收
+                w = ttk.Entry(row, width=80, textvariable=var)
                 w.pack(side=tk.LEFT, fill=tk.X, expand=True)
             else:
-                w = ScrolledText(row, height=4, width=80, wrap=tk.WORD, font=("Segoe UI", 10))
+                # 等宽字体让长文换行 / 光标定位按固定字宽算，
+                # 比例字体逐字形测量在长中文段落里明显更贵；
+                # 撤销栈对这种整条重填的场景只攒垃圾，关掉
+                w = ScrolledText(
+                    row, height=4, width=80, wrap=tk.WORD,
+                    font=("Consolas", 10), undo=False, autoseparators=False, maxundo=0,
+                )
                 w.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+                w.bind("<<Modified>>", lambda e, k=key: self._on_text_modified(e, field=k))
             self.widgets[key] = w
 
-        # 页2：整签 JSON（当前条目的 {} 整段读写）
-        frame_json = ttk.Frame(self.notebook, padding=4)
-        self.notebook.add(frame_json, text="整签 JSON")
-        ttk.Label(frame_json, text="当前条目的 JSON（可整段编辑、粘贴）", font=("Segoe UI", 10)).pack(anchor="w")
-        self.json_text = ScrolledText(
-            frame_json, height=30, width=100, wrap=tk.WORD, font=("Consolas", 10)
+        # 表单内容在启动时一次建齐、行高固定，滚动区域可以一次算死：
+        # 不再绑 <Configure> 去反复 bbox("all") 遍历全部子控件
+        self.frame.update_idletasks()
+        canvas.configure(
+            scrollregion=(0, 0, self.frame.winfo_reqwidth(), self.frame.winfo_reqheight())
         )
-        self.json_text.pack(fill=tk.BOTH, expand=True, pady=4)
-        ttk.Button(frame_json, text="应用当前签", command=self._apply_json_tab).pack(anchor="w", pady=2)
+
+        # 页2：整签 JSON（当前条目的 {} 整段读写）。
+        # 文本框等重量级控件推迟到首次切换到该页时再创建
+        self._frame_json = ttk.Frame(self.notebook, padding=4)
+        self.notebook.add(self._frame_json, text="整签 JSON")
+        ttk.Label(self._frame_json, text="当前条目的 JSON（可整段编辑、粘贴）", font=("Segoe UI", 10)).pack(anchor="w")
 
         ttk.Separator(self.root, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=4)
         ttk.Label(
@@ -160,30 +257,77 @@ class EditorApp:
         self.status = ttk.Label(self.root, text="", font=("Segoe UI", 9), foreground="green")
         self.status.pack(anchor="w", padx=6, pady=2)
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
-        self.root.bind("<Control-s>", lambda e: self._save())
+        self.root.bind("<Control-s>", lambda e: self._save(force=True))
         self.root.bind("<Left>", lambda e: self._prev())
         self.root.bind("<Right>", lambda e: self._next())
 
+    def _mark_dirty(self, event=None, field=None):
+        if not self._rendering:
+            self._dirty = True
+            if field is not None:
+                self._dirty_fields.add(field)
+
+    def _on_text_modified(self, event, field=None):
+        # Tk 的 modified 标志是一次性的，读完必须复位才能收到下一次事件
+        if event.widget.edit_modified():
+            if not self._rendering:
+                self._dirty = True
+                if field is not None:
+                    self._dirty_fields.add(field)
+            event.widget.edit_modified(False)
+
     def _on_tab_changed(self, event=None):
         """切换选项卡时同步：整签 JSON 页用 data 刷新文本框，逐条编辑页用 data 刷新表单。"""
         if not self.data:
             return
+        # 先把表单里未同步的脏字段落回条目再渲染目标页：_show_entry 会清
+        # 脏标记而渲染缓存又跳过内容未变的控件，不先落回这些改动就丢了
+        self._sync_form_fields()
         try:
             idx = self.notebook.index(self.notebook.select())
             if idx == 0:
                 self._show_entry()
             else:
+                if self.json_text is None:
+                    self._build_json_tab()
                 self._refresh_json_tab()
         except Exception:
             pass
 
+    def _build_json_tab(self):
+        """首次进入「整签 JSON」页时才创建文本框与应用按钮。"""
+        self.json_text = ScrolledText(
+            self._frame_json, height=30, width=100, wrap=tk.WORD,
+            font=("Consolas", 10), undo=False, autoseparators=False, maxundo=0,
+        )
+        self.json_text.pack(fill=tk.BOTH, expand=True, pady=4)
+        self.json_text.bind("<<Modified>>", self._on_text_modified)
+        ttk.Button(self._frame_json, text="应用当前签", command=self._apply_json_tab).pack(anchor="w", pady=2)
+
     def _refresh_json_tab(self):
         """用当前条目的 data 刷新「整签 JSON」页的文本框。"""
         entry = self._get_entry()
         if entry is None or self.json_text is None:
             return
-        self.json_text.delete("1.0", tk.END)
-        self.json_text.insert("1.0", json.dumps(entry, ensure_ascii=False, indent=2))
+        # 按条目对象本身（id）键控：删除/新增导致下标整体平移也不伤缓存
+        cache_key = id(entry)
+        text = self._json_cache.get(cache_key)
+        if text is None:
+            if orjson is not None:
+                text = orjson.dumps(entry, option=orjson.OPT_INDENT_2).decode("utf-8")
+            else:
+                text = _ENC(entry)
+            self._json_cache[cache_key] = text
+        # 文本框里已是同一串（如相邻条目内容相同）就不再删除重插
+        if text == self._json_rendered:
+            return
+        self._rendering = True
+        try:
+            self.json_text.delete("1.0", tk.END)
+            self.json_text.insert("1.0", text)
+        finally:
+            self._rendering = False
+        self._json_rendered = text
 
     def _load_file(self):
         try:
@@ -193,6 +337,10 @@ class EditorApp:
                 self.root.quit()
                 return
             self.current_index = 0
+            self._json_cache.clear()
+            self._write_failed = False
+            self._baseline_hash = [_entry_hash(e) for e in self.data]
+            self._rebuild_title_index()
             self._refresh_index()
             self._show_entry()
             self.status.config(text=f"已加载 {len(self.data)} 条")
@@ -203,6 +351,20 @@ class EditorApp:
             messagebox.showerror("错误", f"JSON 解析失败：{e}")
             self.root.quit()
 
+    def _rebuild_title_index(self):
+        """重建 title / tag -> 下标 索引；与线性查找一致，重复键保留首个。"""
+        index = {}
+        by_tag = {}
+        for i, item in enumerate(self.data):
+            index.setdefault(item.get("title", ""), i)
+            tag = item.get("tag", "")
+            if tag:
+                by_tag.setdefault(tag, i)
+        self._title_index = index
+        self._by_tag = by_tag
+        if self.tag_combo is not None:
+            self.tag_combo["values"] = list(by_tag)
+
     def _refresh_index(self):
         n = len(self.data)
         self.index_label.config(text=f"{self.current_index + 1} / {n}")
@@ -216,83 +378,193 @@ class EditorApp:
         entry = self._get_entry()
         if entry is None:
             return
+        # 重绘即视为与数据一致，旧条目残留的脏字段标记不应带到新条目上
+        self._dirty_fields.clear()
+        self._rendering = True
+        try:
+            self._fill_widgets(entry)
+        finally:
+            self._rendering = False
+
+    def _fill_widgets(self, entry):
         for key, w in self.widgets.items():
             val = entry.get(key, "")
-            if isinstance(val, str):
+            ftype = FIELD_TYPES.get(key)
+            if ftype == "json" and not isinstance(val, str):
+                if orjson is not None:
+                    val = orjson.dumps(val, option=orjson.OPT_INDENT_2).decode("utf-8")
+                else:
+                    val = _ENC(val)
+            elif ftype == "bool" and isinstance(val, bool):
+                val = "true" if val else "false"
+            elif isinstance(val, str):
                 pass
             else:
                 val = str(val) if val is not None else ""
+            # 内容没变就不动控件，省掉 Tk 的删除/插入与重排版
+            if self._rendered.get(key) == val:
+                continue
             if key in SHORT_FIELDS:
                 w.delete(0, tk.END)
                 w.insert(0, val)
             else:
-                w.delete("1.0", tk.END)
-                w.insert("1.0", val)
-
-    def _read_entry_from_ui(self):
-        entry = {}
-        for key, w in self.widgets.items():
-            if key in SHORT_FIELDS:
-                entry[key] = w.get().strip()
-            else:
-                entry[key] = w.get("1.0", tk.END).strip()
+                # replace 原地改写文本，比 delete+insert 少一次 B 树重建
+                w.replace("1.0", tk.END, val)
+            self._rendered[key] = val
+
+    def _read_field(self, key):
+        """读取单个字段控件的内容（附带渲染缓存刷新与 index 整数化）。"""
+        w = self.widgets[key]
+        if key in SHORT_FIELDS:
+            val = w.get().strip()
+        else:
+            # "end-1c" 让 Tk 不带结尾换行返回，strip 多数情况下是零拷贝空转
+            val = w.get("1.0", "end-1c").strip()
+        # 读取时顺手刷新渲染缓存，用户手改过的字段下次仍会重绘
+        self._rendered[key] = val
+        ftype = FIELD_TYPES.get(key)
+        if ftype == "json":
+            if not val:
+                return {}
+            try:
+                return orjson.loads(val) if orjson is not None else _DEC(val)
+            except json.JSONDecodeError:
+                # 解析失败不串化写回，保留条目里的原值并提示
+                self.status.config(text=f"{key} 不是合法 JSON，保留原值", foreground="red")
+                entry = self._get_entry()
+                return entry.get(key) if entry is not None else val
+        if ftype == "bool":
+            low = val.lower()
+            if low in ("true", "1", "是", "y"):
+                return True
+            if low in ("false", "0", "否", "n", ""):
+                return False
+            return val  # 既有数据里有字符串取值，识别不了就原样保留
         # index 字段尽量保持为整数，便于下游使用
-        if "index" in entry:
-            val = entry["index"]
-            if isinstance(val, str):
-                s = val.strip()
-                if s.isdigit():
-                    entry["index"] = int(s)
-        return entry
+        if key == "index" and val.isdigit():
+            return int(val)
+        return val
 
     def _apply_json_tab(self):
         """把「整签 JSON」页的文本解析为对象，写回当前条，并刷新表单。"""
         if not self.data or self.json_text is None:
             return
-        raw = self.json_text.get("1.0", tk.END).strip()
+        raw = self.json_text.get("1.0", "end-1c").strip()
         try:
-            obj = json.loads(raw)
+            # 大段粘贴走 orjson 解析（比标准库快数倍）；
+            # orjson.JSONDecodeError 是 json.JSONDecodeError 的子类，报错分支不变
+            obj = orjson.loads(raw) if orjson is not None else _DEC(raw)
             if not isinstance(obj, dict):
                 messagebox.showerror("错误", "JSON 必须是单个对象 {}")
                 return
+            # 旧条目对象被替换，按 id 把它的缓存摘掉（防止 id 复用串台）
+            old = self.data[self.current_index]
             self.data[self.current_index] = obj
+            self._dirty = True
+            self._json_cache.pop(id(old), None)
+            self._rebuild_title_index()
             self._show_entry()
             self.status.config(text="已应用到当前签", foreground="green")
             self.root.after(2000, lambda: self.status.config(text=""))
         except json.JSONDecodeError as e:
             messagebox.showerror("JSON 解析失败", str(e))
 
+    def _sync_form_fields(self):
+        """把表单里被用户动过的字段就地写回当前条目（无脏字段则为空转）。
+
+        表单页同步和离开表单页（切换选项卡）都走这里：只读真正动过的
+        控件，其余字段（含 blind_safe、match_weights 等未知键）原样保留。
+        """
+        entry = self._get_entry()
+        if entry is None or not self._dirty_fields:
+            return
+        for key in self._dirty_fields:
+            entry[key] = self._read_field(key)
+        self._dirty_fields.clear()
+        # 条目内容变了：整签 JSON 缓存失效，title/tag 索引重建
+        self._json_cache.pop(id(entry), None)
+        self._rebuild_title_index()
+
     def _sync_current_tab_to_data(self):
         """把当前选项卡的内容写回 self.data[current_index]。"""
         if not self.data:
             return
         try:
             idx = self.notebook.index(self.notebook.select())
-            if idx == 0:
-                # 表单页：只覆盖已知字段，保留 blind_safe、match_weights 等其他键
-                base = self._get_entry() or {}
-                updated = dict(base)
-                updated.update(self._read_entry_from_ui())
-                self.data[self.current_index] = updated
-            else:
-                raw = self.json_text.get("1.0", tk.END).strip()
-                obj = json.loads(raw)
-                if isinstance(obj, dict):
-                    self.data[self.current_index] = obj
+        except Exception:
+            idx = 0
+        if idx == 0:
+            self._sync_form_fields()
+            return
+        old = self._get_entry()
+        try:
+            raw = self.json_text.get("1.0", "end-1c").strip()
+            # 同步时顺手刷新渲染缓存，用户手改过的内容下次仍会重绘
+            self._json_rendered = raw
+            obj = _DEC(raw)
+            if isinstance(obj, dict):
+                self.data[self.current_index] = obj
         except Exception:
             pass
+        else:
+            if old is not None:
+                self._json_cache.pop(id(old), None)
+            self._rebuild_title_index()
 
-    def _save(self):
+    def _save(self, force=False):
         if not self.data:
             return
+        # 没有任何编辑时跳过整文件序列化与落盘；显式保存（按钮 / Ctrl+S）不跳
+        if not (force or self._dirty):
+            return
         self._sync_current_tab_to_data()
+        # 脏标记可能是误报（按键后又改回原样等）：同步只会动当前条，
+        # 指纹与落盘基线一致且条目数没变，就确实无需写盘。
+        # 写盘失败过则另当别论——内存里可能有别的条目还没落盘，
+        # 当前条指纹没变不代表整体没变，短路要停用到下次写成为止
+        i = self.current_index
+        if (
+            not self._write_failed
+            and len(self._baseline_hash) == len(self.data)
+            and 0 <= i < len(self.data)
+            and _entry_hash(self.data[i]) == self._baseline_hash[i]
+        ):
+            self._dirty = False
+            if force:
+                self.status.config(text="内容未变化，无需保存", foreground="green")
+                self.root.after(2000, lambda: self.status.config(text=""))
+            return
         try:
-            save_json(self.data)
-            self.status.config(text="已保存到 tanjing.json", foreground="green")
-            self.root.after(2000, lambda: self.status.config(text=""))
+            # 序列化在 UI 线程完成（orjson 下很快），落盘丢给后台线程，
+            # 大文件写出时主循环不再卡顿；单工作线程保证写入顺序
+            buf = _serialize(self.data)
         except Exception as e:
             messagebox.showerror("保存失败", str(e))
             self.status.config(text=str(e), foreground="red")
+            return
+        self._dirty = False
+        # 新基线在 UI 线程先算好（data 随后可能继续被编辑），
+        # 但要等后台确实写成才生效：提前更新的话写盘一旦失败，
+        # 后续保存全被指纹短路挡下，改动就再也落不了盘
+        baseline = [_entry_hash(e) for e in self.data]
+        self.status.config(text="保存中…", foreground="green")
+        future = self._io_pool.submit(_write_atomic, buf)
+        future.add_done_callback(
+            lambda f, b=baseline: self.root.after(0, self._on_save_done, f, b)
+        )
+
+    def _on_save_done(self, future, baseline):
+        err = future.exception()
+        if err is not None:
+            self._dirty = True  # 落盘失败，改动仍待保存；基线维持上次成功值
+            self._write_failed = True
+            messagebox.showerror("保存失败", str(err))
+            self.status.config(text=str(err), foreground="red")
+            return
+        self._write_failed = False
+        self._baseline_hash = baseline
+        self.status.config(text="已保存到 textMaterial.json", foreground="green")
+        self.root.after(2000, lambda: self.status.config(text=""))
 
     def _prev(self):
         self._save()
@@ -342,11 +614,7 @@ class EditorApp:
             return
         # 先保存当前修改
         self._save()
-        found_index = None
-        for i, item in enumerate(self.data):
-            if item.get("title", "") == title:
-                found_index = i
-                break
+        found_index = self._title_index.get(title)
         if found_index is None:
             messagebox.showinfo("未找到", f"未找到 title 为：{title} 的条目")
             return
@@ -355,6 +623,20 @@ class EditorApp:
         self._show_entry()
         self._refresh_json_tab()
 
+    def _goto_tag(self, event=None):
+        """下拉选中 tag 后经索引 O(1) 跳转到对应条目。"""
+        if not self.data:
+            return
+        found_index = self._by_tag.get(self.tag_combo.get())
+        if found_index is None:
+            return
+        # 先保存当前修改
+        self._save()
+        self.current_index = found_index
+        self._refresh_index()
+        self._show_entry()
+        self._refresh_json_tab()
+
     def _delete_current_entry(self):
         """删除当前条目（需弹窗确认）。"""
         if not self.data:
@@ -374,9 +656,15 @@ class EditorApp:
         # 先保存当前修改，再删除
         self._sync_current_tab_to_data()
         try:
+            removed = self.data[idx]
             del self.data[idx]
+            self._json_cache.pop(id(removed), None)
+            self._rebuild_title_index()
             if not self.data:
                 save_json(self.data)
+                self._dirty = False
+                self._write_failed = False
+                self._baseline_hash = []
                 self.current_index = 0
                 self.index_label.config(text="0 / 0")
                 for key, w in self.widgets.items():
@@ -384,8 +672,10 @@ class EditorApp:
                         w.delete(0, tk.END)
                     else:
                         w.delete("1.0", tk.END)
+                self._rendered.clear()
                 if self.json_text is not None:
                     self.json_text.delete("1.0", tk.END)
+                    self._json_rendered = None
                 self.status.config(text="已删除，当前无条目", foreground="green")
                 self.root.after(2000, lambda: self.status.config(text=""))
                 return
@@ -393,6 +683,9 @@ class EditorApp:
             if self.current_index >= len(self.data):
                 self.current_index = len(self.data) - 1
             save_json(self.data)
+            self._dirty = False
+            self._write_failed = False
+            self._baseline_hash = [_entry_hash(e) for e in self.data]
             self._refresh_index()
             self._show_entry()
             self._refresh_json_tab()
@@ -412,6 +705,8 @@ class EditorApp:
 
         # 新增一条空对象，由用户自行填写各字段（包括 index / angle 等）
         self.data.append({})
+        self._dirty = True
+        self._rebuild_title_index()
         self.current_index = len(self.data) - 1
         self._refresh_index()
         self._show_entry()
@@ -420,6 +715,8 @@ class EditorApp:
         self.root.after(2000, lambda: self.status.config(text=""))
 
     def _on_close(self):
+        # 等后台写盘收尾再退出，避免 os.replace 做到一半进程没了
+        self._io_pool.shutdown(wait=True)
         self.root.quit()
 
     def run(self):
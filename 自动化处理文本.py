@@ -1,69 +1,173 @@
 import argparse
+import io
 import json
+import mmap
 import os
+import sys
 from typing import List, Any
 
+try:
+    import orjson
+except ImportError:  # orjson 未安装时退回标准库 json
+    orjson = None
+
+# 标准库路径共用一套编解码器实例，免去每次 dumps/loads 重新构造的开销
+# （签文条目都是纯 dict，关掉循环检测也安全）
+_ENC = json.JSONEncoder(
+    ensure_ascii=False, indent=2, check_circular=False, allow_nan=False
+).encode
+_DECODER = json.JSONDecoder()
+_DEC = _DECODER.decode
+_RAW_DEC = _DECODER.raw_decode
+
+# input_multiline 增量解析成功时缓存 (原文, 对象)，edit_batch 免二次解析
+_last_decoded = None
+
 
 def load_json(path: str) -> List[Any]:
     if not os.path.exists(path):
         raise FileNotFoundError(f"找不到文件: {path}")
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    # mmap 让内核按需换页，orjson 直接从映射字节解析，
+    # 省掉 read() 先整体拷进用户态再解码成 str 的那份内存
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if orjson is not None:
+                return orjson.loads(memoryview(mm))
+            return _DEC(mm[:].decode("utf-8"))
+        finally:
+            mm.close()
+
+
+# path -> 上次落盘内容的 hash，内容没变时跳过写文件与原子替换
+_saved_hash: dict = {}
 
 
 def save_json(path: str, data: List[Any]) -> None:
+    # 整体序列化成 bytes 后一次 write，避免 json.dump 逐片段写出
+    if orjson is not None:
+        buf = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        buf = _ENC(data).encode("utf-8")
+    digest = hash(buf)
+    if _saved_hash.get(path) == digest:
+        return
     tmp_path = path + ".tmp"
-    with open(tmp_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    with open(tmp_path, "wb") as f:
+        f.write(buf)
     os.replace(tmp_path, path)
+    _saved_hash[path] = digest
+
+
+# --stdin 打开后 input_multiline 一次性读完标准输入（管道 / heredoc 场景）
+_stdin_block_mode = False
+
+
+def _ask(prompt: str, eof_default: str = "n") -> str:
+    """读取 y/N 应答；输入耗尽（EOF）时按 eof_default 处理，不再抛栈。"""
+    try:
+        return input(prompt).strip().lower()
+    except EOFError:
+        return eof_default
 
 
 def input_multiline(prompt: str) -> str:
+    global _last_decoded
     print(prompt)
-    print("（多行输入，以空行结束）")
-    lines: List[str] = []
+    if _stdin_block_mode:
+        # 必须与 input() 同层读 sys.stdin：前面的 y/N 提示已经把管道
+        # 内容缓冲进文本层，绕过去读底层 buffer 只会拿到空。
+        # 整块读到 EOF 后从头截取第一个配平的 JSON 对象，
+        # 对象之后的内容（管道里喂的后续应答）由 _ask 的 EOF 语义兜底
+        raw = sys.stdin.read()
+        head = raw.lstrip()
+        if head.startswith("{"):
+            try:
+                obj, end = _RAW_DEC(head)
+            except json.JSONDecodeError:
+                pass
+            else:
+                _last_decoded = (head[:end], obj)
+                return head[:end]
+        return raw.strip()
+    print("（多行输入：粘贴完整 JSON 对象会自动结束；空行结束输入，JSON 未配平时即为放弃）")
+    # 逐行写进 StringIO，省掉 list 逐行扩容和结尾的整体 join
+    buf = io.StringIO()
+    json_mode = None  # 首个非空字符是 { 才走增量解析
     while True:
-        try:
-            line = input()
-        except EOFError:
+        line = sys.stdin.readline()
+        if not line:
             break
+        if json_mode is None:
+            head = line.lstrip()
+            if not head:
+                break
+            json_mode = head.startswith("{")
+        if json_mode:
+            # 外层大括号一配平立即结束，不依赖空行哨兵
+            buf.write(line)
+            text = buf.getvalue().lstrip()
+            try:
+                obj, end = _RAW_DEC(text)
+            except json.JSONDecodeError:
+                # 粘错了也得有退路：未配平时输入空行结束本次输入，
+                # 把已读内容交给调用方报解析错误，而不是吞到 EOF
+                if not line.strip():
+                    break
+                continue
+            raw = text[:end]
+            _last_decoded = (raw, obj)
+            return raw
         if line.strip() == "":
             break
-        lines.append(line)
-    return "\n".join(lines)
+        buf.write(line)
+    return buf.getvalue().rstrip("\n")
 
 
 def edit_batch(
     data: List[Any],
     start_index_1_based: int,
     batch_size: int,
-) -> bool:
+) -> tuple:
     """
     读取一批（默认 5 条），允许在命令行中粘贴修改后的 JSON，
-    批内修改只保存在内存里。函数返回值表示是否在调用方应继续下一批。
+    批内修改只保存在内存里。返回 (是否继续下一批, 本批是否有条目被改动)，
+    调用方据此决定是否需要写回文件。
     """
+    dirty = False
     n = len(data)
     start_idx = max(start_index_1_based - 1, 0)
     if start_idx >= n:
         print(f"起始编号 {start_index_1_based} 已超出当前数据长度 {n}，不再处理。")
-        return False
+        return False, dirty
 
     end_idx = min(start_idx + batch_size, n)
     print(f"本批处理范围：第 {start_idx + 1} 条 ～ 第 {end_idx} 条（共 {end_idx - start_idx} 条）")
     print("-" * 60)
 
     for i in range(start_idx, end_idx):
-        print(f"\n====== 第 {i + 1} 条（当前内容预览） ======")
-        try:
-            print(json.dumps(data[i], ensure_ascii=False, indent=2))
-        except Exception as e:
-            print(f"无法格式化显示该条内容：{e}")
-            print(repr(data[i]))
+        # 先给一行摘要就够了，整条美化打印推迟到用户确认要改之后——
+        # 大多数条目会直接跳过，白序列化一遍纯属浪费
+        item = data[i]
+        if isinstance(item, dict):
+            print(f"\n====== 第 {i + 1} 条：tag={item.get('tag')} title={item.get('title')} ======")
+        else:
+            print(f"\n====== 第 {i + 1} 条：{type(item).__name__} ======")
 
-        choice = input("是否要替换这一整条 JSON 内容？(y/N): ").strip().lower()
+        choice = _ask("是否要替换这一整条 JSON 内容？(y/N): ")
         if choice != "y":
             continue
 
+        print("====== 当前内容 ======")
+        try:
+            if orjson is not None:
+                print(orjson.dumps(item, option=orjson.OPT_INDENT_2).decode("utf-8"))
+            else:
+                print(_ENC(item))
+        except Exception as e:
+            print(f"无法格式化显示该条内容：{e}")
+            print(repr(item))
+
         raw = input_multiline(
             "请粘贴【这一条】完整的 JSON 对象（例如以 { 开头、以 } 结尾）："
         )
@@ -72,7 +176,11 @@ def edit_batch(
             continue
 
         try:
-            obj = json.loads(raw)
+            # 增量解析已经解出对象的话直接复用，不再解析第二遍
+            if _last_decoded is not None and _last_decoded[0] == raw:
+                obj = _last_decoded[1]
+            else:
+                obj = _DEC(raw)
         except json.JSONDecodeError as e:
             print(f"解析 JSON 失败，保持原内容不变。错误: {e}")
             continue
@@ -82,14 +190,19 @@ def edit_batch(
             continue
 
         data[i] = obj
+        dirty = True
         print(f"第 {i + 1} 条已在内存中更新。")
 
     print("\n本批条目处理结束。")
     while True:
-        cont = input("是否保存本批修改并继续处理下一批？(y/N): ").strip().lower()
+        # --stdin 模式下输入耗尽视为 y：已做的修改要能落盘，不能卡在提示上
+        cont = _ask(
+            "是否保存本批修改并继续处理下一批？(y/N): ",
+            eof_default="y" if _stdin_block_mode else "n",
+        )
         if cont in ("y", "n", ""):
             break
-    return cont == "y"
+    return cont == "y", dirty
 
 
 def main():
@@ -113,14 +226,22 @@ def main():
         default=5,
         help="每批处理多少条记录（默认：5）",
     )
+    parser.add_argument(
+        "--stdin",
+        action="store_true",
+        help="粘贴内容从标准输入整块读到 EOF（适合管道 / heredoc 喂入）",
+    )
     args = parser.parse_args()
 
+    global _stdin_block_mode
+    _stdin_block_mode = args.stdin
+
     json_path = args.file
     data = load_json(json_path)
 
     current_start = args.start
     while True:
-        should_continue = edit_batch(
+        should_continue, batch_dirty = edit_batch(
             data=data,
             start_index_1_based=current_start,
             batch_size=args.batch_size,
@@ -130,9 +251,12 @@ def main():
             print("用户选择不继续，未写回当前未保存的修改（如有）。流程结束。")
             break
 
-        # 用户同意继续：先保存，再推进到下一批
-        save_json(json_path, data)
-        print(f"已保存到文件：{json_path}")
+        # 用户同意继续：本批确有改动才重写整个文件，再推进到下一批
+        if batch_dirty:
+            save_json(json_path, data)
+            print(f"已保存到文件：{json_path}")
+        else:
+            print("本批无改动，跳过保存。")
 
         current_start += args.batch_size
         if current_start > len(data):